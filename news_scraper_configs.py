@@ -3,6 +3,30 @@
 # This file contains selector configurations for different news websites
 
 import datetime
+import functools
+import logging
+from types import MappingProxyType
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Use orjson for config JSON I/O when it is installed
+try:
+    import orjson
+    
+    def _json_loads(data):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    def _json_loads(data):
+        return json.loads(data)
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
 
 # You can easily add or update configurations here
 # When a website changes its HTML structure, just update the selectors
@@ -22,7 +46,8 @@ SITE_CONFIGURATIONS = {
             'image': 'img'
         },
         'remove_duplicates': True,
-        'timeout': 20
+        'timeout': 20,
+        'parser': 'lxml'
     },
     
     'cnn': {
@@ -39,7 +64,8 @@ SITE_CONFIGURATIONS = {
             'image': 'img'
         },
         'remove_duplicates': True,
-        'timeout': 20
+        'timeout': 20,
+        'parser': 'lxml'
     },
     
     'reuters': {
@@ -56,7 +82,8 @@ SITE_CONFIGURATIONS = {
             'image': 'img'
         },
         'remove_duplicates': True,
-        'timeout': 20
+        'timeout': 20,
+        'parser': 'lxml'
     },
     
     'nytimes': {
@@ -73,7 +100,8 @@ SITE_CONFIGURATIONS = {
             'image': 'img'
         },
         'remove_duplicates': True,
-        'timeout': 20
+        'timeout': 20,
+        'parser': 'lxml'
     },
     
     'guardian': {
@@ -90,7 +118,8 @@ SITE_CONFIGURATIONS = {
             'image': 'img'
         },
         'remove_duplicates': True,
-        'timeout': 20
+        'timeout': 20,
+        'parser': 'lxml'
     },
     
     'wsj': {
@@ -107,7 +136,8 @@ SITE_CONFIGURATIONS = {
             'image': 'img'
         },
         'remove_duplicates': True,
-        'timeout': 20
+        'timeout': 20,
+        'parser': 'lxml'
     },
     
     'apnews': {
@@ -124,19 +154,36 @@ SITE_CONFIGURATIONS = {
             'image': 'img'
         },
         'remove_duplicates': True,
-        'timeout': 20
+        'timeout': 20,
+        'parser': 'lxml'
     }
 }
 
+def _freeze_config(config):
+    """Return a read-only view of a site configuration with selector lists stored as tuples"""
+    frozen = dict(config)
+    if isinstance(frozen.get('article_container'), list):
+        frozen['article_container'] = tuple(frozen['article_container'])
+    if 'selectors' in frozen:
+        frozen['selectors'] = {key: tuple(selector) if isinstance(selector, list) else selector
+                               for key, selector in frozen['selectors'].items()}
+    return MappingProxyType(frozen)
+
+# Site configurations are read-only; update them by editing the dict above or loading JSON
+SITE_CONFIGURATIONS.update({site: _freeze_config(config) for site, config in SITE_CONFIGURATIONS.items()})
+
 # Custom date parsers for specific sites (if needed)
-def parse_bbc_date(date_str):
-    """Parse BBC's date format"""
-    if 'hrs ago' in date_str:
-        hours = int(date_str.split()[0])
-        return (datetime.datetime.now() - datetime.timedelta(hours=hours)).isoformat()
-    elif 'min ago' in date_str:
-        minutes = int(date_str.split()[0])
-        return (datetime.datetime.now() - datetime.timedelta(minutes=minutes)).isoformat()
+def parse_bbc_date(date_str, now=None):
+    """Parse BBC's date format
+    
+    Pass ``now`` to share one reference time across a whole scrape.
+    """
+    if date_str.endswith(('hrs ago', 'min ago')):
+        now = now or datetime.datetime.now()
+        amount = int(date_str.split()[0])
+        if date_str.endswith('hrs ago'):
+            return (now - datetime.timedelta(hours=amount)).isoformat()
+        return (now - datetime.timedelta(minutes=amount)).isoformat()
     return date_str
 
 def parse_cnn_date(date_str):
@@ -176,9 +223,16 @@ CUSTOM_POST_PROCESSORS = {
 }
 
 # Helper function to add custom processors to configs
+@functools.lru_cache(maxsize=None)
 def get_config_with_processors(site_key):
-    """Get configuration with custom processors if available"""
-    config = SITE_CONFIGURATIONS.get(site_key, {}).copy()
+    """Get a read-only configuration with custom processors if available
+    
+    The result is cached, so callers that need to modify it must copy it first.
+    """
+    if site_key not in SITE_CONFIGURATIONS:
+        return MappingProxyType({})
+    
+    config = dict(SITE_CONFIGURATIONS[site_key])
     
     if site_key in CUSTOM_DATE_PARSERS:
         config['date_parser'] = CUSTOM_DATE_PARSERS[site_key]
@@ -186,42 +240,44 @@ def get_config_with_processors(site_key):
     if site_key in CUSTOM_POST_PROCESSORS:
         config['post_process'] = CUSTOM_POST_PROCESSORS[site_key]
     
-    return config
+    return MappingProxyType(config)
 
 # Utility function to update configurations from a JSON file
 def load_configs_from_json(json_file):
     """Load configurations from a JSON file and merge with existing configs"""
-    import json
     try:
-        with open(json_file, 'r') as f:
-            json_configs = json.load(f)
-            SITE_CONFIGURATIONS.update(json_configs)
-        print(f"Loaded configurations from {json_file}")
+        with open(json_file, 'rb') as f:
+            json_configs = _json_loads(f.read())
+            SITE_CONFIGURATIONS.update((site, _freeze_config(config)) for site, config in json_configs.items())
+        # Drop cached configurations so the reloaded values are used
+        get_config_with_processors.cache_clear()
+        logger.info(f"Loaded configurations from {json_file}")
     except Exception as e:
-        print(f"Could not load configurations from {json_file}: {str(e)}")
+        logger.warning(f"Could not load configurations from {json_file}: {str(e)}")
+
+# Config keys that hold functions and can't be saved to JSON
+_NON_SERIALIZABLE_KEYS = frozenset({'date_parser', 'post_process'})
 
 # Save current configurations to JSON for easy editing
 def save_configs_to_json(json_file='site_configs.json'):
     """Save current configurations to a JSON file"""
-    import json
     try:
         # Remove function references for JSON serialization
-        json_configs = {}
-        for site, config in SITE_CONFIGURATIONS.items():
-            json_config = config.copy()
-            # Remove non-serializable items
-            json_config.pop('date_parser', None)
-            json_config.pop('post_process', None)
-            json_configs[site] = json_config
+        json_configs = {
+            site: {key: value for key, value in config.items() if key not in _NON_SERIALIZABLE_KEYS}
+            for site, config in SITE_CONFIGURATIONS.items()
+        }
         
-        with open(json_file, 'w') as f:
-            json.dump(json_configs, f, indent=2)
-        print(f"Saved configurations to {json_file}")
+        with open(json_file, 'wb') as f:
+            f.write(_json_dumps(json_configs))
+        logger.info(f"Saved configurations to {json_file}")
     except Exception as e:
-        print(f"Could not save configurations to {json_file}: {str(e)}")
+        logger.warning(f"Could not save configurations to {json_file}: {str(e)}")
 
 # Usage example
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     # Save current configs to JSON for easy editing
     save_configs_to_json()
     
@@ -3,9 +3,100 @@
 # Uses the universal scraper with modular site configurations
 
 import argparse
+import hashlib
+import logging
 import sys
-from site_configs import SITE_CONFIGURATIONS, get_site_config, list_available_sites
-from universal_news_scraper import UniversalNewsScraper
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+def article_fingerprint(article):
+    """Get a compact fingerprint of an article's title and link for duplicate detection"""
+    key = f"{article.get('title') or ''}\x00{article.get('link') or ''}"
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+
+def create_config(site_key, site_name, site_url):
+    """Create a new site configuration template"""
+    from site_configs.config_manager import create_new_site_config
+    create_new_site_config(site_key, site_name, site_url)
+
+def list_sites():
+    """Print all available sites"""
+    from site_configs import get_site_config, list_available_sites
+    print("Available news sites:")
+    sites = list_available_sites()
+    for site_key in sorted(sites):
+        config = get_site_config(site_key)
+        if config:
+            print(f"  {site_key}: {config.get('name', site_key)}")
+
+def validate_sites():
+    """Validate all site configurations"""
+    from site_configs import list_available_sites
+    from site_configs.config_manager import validate_config
+    print("Validating site configurations...")
+    for site_key in list_available_sites():
+        is_valid, message = validate_config(site_key)
+        status = "✓" if is_valid else "✗"
+        print(f"{status} {site_key}: {message}")
+
+def scrape_site(site_key, args, session):
+    """Scrape a single site and save its individual results"""
+    from site_configs import get_site_config
+    from universal_news_scraper import UniversalNewsScraper
+    verbose = args.verbose
+    try:
+        config = get_site_config(site_key)
+        print(f"\n{'=' * 50}")
+        print(f"Scraping {config.get('name', site_key)}")
+        print('=' * 50)
+        
+        # Create scraper instance
+        cache_ttl = 0 if args.no_cache else args.cache_ttl
+        scraper = UniversalNewsScraper(config, verbose=verbose, session=session, cache_ttl=cache_ttl,
+                                       debug=args.debug)
+        
+        # Scrape articles
+        articles = scraper.scrape_news()
+        
+        # Limit articles if requested
+        if args.max_articles and len(articles) > args.max_articles:
+            articles = articles[:args.max_articles]
+            if verbose:
+                print(f"Limited to {args.max_articles} articles")
+        
+        if articles:
+            print(f"Found {len(articles)} articles from {config.get('name', site_key)}")
+            
+            # Save individual site results
+            if not args.combine and not args.one_file:
+                if args.output in ['json', 'both']:
+                    scraper.save_to_json(articles)
+                
+                if args.output in ['csv', 'both']:
+                    scraper.save_to_csv(articles)
+            
+            # Print first few articles as sample
+            if verbose:
+                print("\nSample articles:")
+                for i, article in enumerate(articles[:3], start=1):
+                    print(f"  {i}. {article['title'][:60]}...")
+                
+                # Show configuration being used
+                print(f"\nConfiguration summary:")
+                print(f"  URL: {config['url']}")
+                print(f"  Container: {config['article_container']}")
+                print(f"  Custom processors: {'Yes' if config.get('date_parser') or config.get('post_process') else 'No'}")
+        else:
+            print(f"No articles found from {config.get('name', site_key)}")
+        
+        return articles
+    
+    except Exception as e:
+        print(f"Error scraping {site_key}: {str(e)}")
+        if verbose:
+            import traceback
+            traceback.print_exc()
+        return []
 
 def main():
     # Parse command line arguments
@@ -17,53 +108,58 @@ def main():
     parser.add_argument('--output', choices=['json', 'csv', 'both'], default='both', help='Output format')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
     parser.add_argument('--combine', action='store_true', help='Combine results from all sites')
+    parser.add_argument('--one-file', action='store_true',
+                       help='Save every site into a single news.json/news.csv without merging duplicates')
     parser.add_argument('--max-articles', type=int, help='Maximum articles per site')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum number of sites scraped in parallel')
+    parser.add_argument('--cache-ttl', type=int, default=300, metavar='SECONDS',
+                       help='Reuse pages fetched within this many seconds (default: 300)')
+    parser.add_argument('--no-cache', action='store_true', help='Always fetch fresh pages')
+    parser.add_argument('--debug', action='store_true', help='Save each fetched page as HTML for debugging')
     parser.add_argument('--validate', action='store_true', help='Validate site configurations')
     parser.add_argument('--create-config', nargs=3, metavar=('SITE_KEY', 'SITE_NAME', 'SITE_URL'),
                        help='Create a new site configuration')
     
     args = parser.parse_args()
     
-    # Create new configuration if requested
+    # Show configuration warnings, and load details when verbose
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+    if args.verbose:
+        logging.getLogger('site_configs').setLevel(logging.DEBUG)
+    
+    # Dispatch management commands before loading anything they don't need
     if args.create_config:
-        site_key, site_name, site_url = args.create_config
-        from site_configs.config_manager import create_new_site_config
-        create_new_site_config(site_key, site_name, site_url)
+        create_config(*args.create_config)
         return
     
-    # List available sites if requested
     if args.list:
-        print("Available news sites:")
-        sites = list_available_sites()
-        for site_key in sorted(sites):
-            config = get_site_config(site_key)
-            if config:
-                print(f"  {site_key}: {config.get('name', site_key)}")
+        list_sites()
         return
     
-    # Validate configurations if requested
     if args.validate:
-        from site_configs.config_manager import config_manager
-        print("Validating site configurations...")
-        for site_key in list_available_sites():
-            is_valid, message = config_manager.validate_config(site_key)
-            status = "✓" if is_valid else "✗"
-            print(f"{status} {site_key}: {message}")
+        validate_sites()
         return
     
+    # Only the scraping path needs requests and BeautifulSoup
+    from site_configs import list_available_sites
+    from universal_news_scraper import ArticleStreamWriter, create_session
+    
     # Determine which sites to scrape
     sites_to_scrape = []
     
     if args.all:
         sites_to_scrape = list_available_sites()
     elif args.sites:
-        # Validate requested sites
-        for site in args.sites:
-            if site.lower() in list_available_sites():
-                sites_to_scrape.append(site.lower())
-            else:
-                print(f"Warning: Site '{site}' not found in configurations")
-                print(f"Available sites: {', '.join(sorted(list_available_sites()))}")
+        # Validate requested sites against the available ones in a single pass
+        available = frozenset(list_available_sites())
+        requested = list(dict.fromkeys(site.lower() for site in args.sites))
+        sites_to_scrape = [site for site in requested if site in available]
+        unknown_sites = [site for site in requested if site not in available]
+        
+        for site in unknown_sites:
+            print(f"Warning: Site '{site}' not found in configurations")
+        if unknown_sites:
+            print(f"Available sites: {', '.join(sorted(available))}")
     else:
         # Default to BBC if no sites specified
         sites_to_scrape = ['bbc']
@@ -73,88 +169,63 @@ def main():
         print("No valid sites to scrape. Use --list to see available sites.")
         return
     
-    # Storage for all articles
-    all_articles = []
+    # Combined and single-file results are streamed to disk as each site finishes.
+    # Combined mode also skips articles already seen on another site, keeping
+    # only fixed-size fingerprints of them
+    output_writer = None
+    seen_articles = set()
+    source_counts = Counter()
+    if args.combine or args.one_file:
+        output_writer = ArticleStreamWriter('combined_news' if args.combine else 'news',
+                                            write_json=args.output in ['json', 'both'],
+                                            write_csv=args.output in ['csv', 'both'])
     
-    # Scrape each site
-    for site_key in sites_to_scrape:
-        try:
-            print(f"\n{'=' * 50}")
-            config = get_site_config(site_key)
-            print(f"Scraping {config.get('name', site_key)}")
-            print('=' * 50)
-            
-            # Create scraper instance
-            scraper = UniversalNewsScraper(config, verbose=args.verbose)
-            
-            # Scrape articles
-            articles = scraper.scrape_news()
-            
-            # Limit articles if requested
-            if args.max_articles and len(articles) > args.max_articles:
-                articles = articles[:args.max_articles]
-                if args.verbose:
-                    print(f"Limited to {args.max_articles} articles")
-            
-            if articles:
-                print(f"Found {len(articles)} articles from {config.get('name', site_key)}")
+    # Share one pooled HTTP session so connections are reused across sites
+    session = create_session()
+    
+    # Scrape sites concurrently, bounded by the requested concurrency
+    max_workers = max(1, min(args.concurrency, len(sites_to_scrape)))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for articles in executor.map(lambda site_key: scrape_site(site_key, args, session), sites_to_scrape):
+                if not output_writer:
+                    continue
                 
-                # Save individual site results
-                if not args.combine:
-                    if args.output in ['json', 'both']:
-                        scraper.save_to_json(articles)
+                if args.combine:
+                    unique_articles = []
+                    for article in articles:
+                        fingerprint = article_fingerprint(article)
+                        if fingerprint in seen_articles:
+                            continue
+                        seen_articles.add(fingerprint)
+                        unique_articles.append(article)
                     
-                    if args.output in ['csv', 'both']:
-                        scraper.save_to_csv(articles)
+                    articles = unique_articles
+                    source_counts.update(article.get('source', 'Unknown') for article in articles)
                 
-                # Add to combined results
-                all_articles.extend(articles)
-                
-                # Print first few articles as sample
-                if args.verbose and articles:
-                    print("\nSample articles:")
-                    for i, article in enumerate(articles[:3]):
-                        print(f"  {i+1}. {article['title'][:60]}...")
-                        
-                    # Show configuration being used
-                    print(f"\nConfiguration summary:")
-                    print(f"  URL: {config['url']}")
-                    print(f"  Container: {config['article_container']}")
-                    print(f"  Custom processors: {'Yes' if config.get('date_parser') or config.get('post_process') else 'No'}")
-            else:
-                print(f"No articles found from {config.get('name', site_key)}")
-        
-        except Exception as e:
-            print(f"Error scraping {site_key}: {str(e)}")
-            if args.verbose:
-                import traceback
-                traceback.print_exc()
+                output_writer.write(articles)
+    finally:
+        # Finish the output files even if scraping fails or is interrupted, so the JSON stays valid
+        saved_paths = output_writer.close() if output_writer else []
     
-    # Save combined results if requested
-    if args.combine and all_articles:
-        print(f"\n{'=' * 50}")
-        print(f"Combined Results: {len(all_articles)} total articles")
-        print('=' * 50)
-        
-        # Create combined scraper for saving
-        combined_config = {'name': 'Combined News'}
-        combined_scraper = UniversalNewsScraper(combined_config, verbose=args.verbose)
-        
-        if args.output in ['json', 'both']:
-            combined_scraper.save_to_json(all_articles, 'combined_news.json')
-        
-        if args.output in ['csv', 'both']:
-            combined_scraper.save_to_csv(all_articles, 'combined_news.csv')
-        
-        # Print summary statistics
-        print("\nSummary by source:")
-        source_counts = {}
-        for article in all_articles:
-            source = article.get('source', 'Unknown')
-            source_counts[source] = source_counts.get(source, 0) + 1
-        
-        for source, count in sorted(source_counts.items()):
-            print(f"  {source}: {count} articles")
+    if output_writer:
+        # Report combined results if requested
+        if args.combine and output_writer.count:
+            print(f"\n{'=' * 50}")
+            print(f"Combined Results: {output_writer.count} total articles")
+            print('=' * 50)
+            
+            if args.verbose:
+                for path in saved_paths:
+                    print(f"Combined data saved to: {path}")
+            
+            # Print summary statistics
+            print("\nSummary by source:")
+            for source, count in sorted(source_counts.items()):
+                print(f"  {source}: {count} articles")
+        elif args.verbose:
+            for path in saved_paths:
+                print(f"Data saved to: {path}")
     
     print("\nScraping completed!")
 
@@ -1,49 +1,73 @@
 #!/usr/bin/env python3
 # Site configuration package initializer
-# Automatically loads all site configurations
+# Discovers all site configurations and loads them lazily on first access
 
 import os
 import importlib
 import inspect
+import functools
+import logging
+from types import MappingProxyType
 
-# Dictionary to store all site configurations
-SITE_CONFIGURATIONS = {}
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Get the directory containing this file
 config_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Automatically import all config modules
-for filename in os.listdir(config_dir):
-    if filename.endswith('_config.py') and not filename.startswith('__'):
-        # Remove .py extension and import module
-        module_name = filename[:-3]
-        
-        try:
-            # Import the module
-            module = importlib.import_module(f'.{module_name}', package='site_configs')
-            
-            # Look for site configuration in the module
-            if hasattr(module, 'SITE_CONFIG'):
-                config = module.SITE_CONFIG
-                site_key = module_name.replace('_config', '')
-                SITE_CONFIGURATIONS[site_key] = config
-                print(f"Loaded configuration for: {config.get('name', site_key)}")
-        
-        except Exception as e:
-            print(f"Warning: Could not load {module_name}: {str(e)}")
+# Map of site key to config module name, built from a single directory scan
+with os.scandir(config_dir) as entries:
+    _MODULE_MAP = {
+        entry.name[:-len('_config.py')]: entry.name[:-3]
+        for entry in entries
+        if entry.name.endswith('_config.py') and not entry.name.startswith('__') and entry.is_file()
+    }
+
+# Dictionary of site configurations loaded so far
+SITE_CONFIGURATIONS = {}
+
+def _load_site_config(site_key):
+    """Import a site's config module on first access and cache its configuration"""
+    if site_key in SITE_CONFIGURATIONS:
+        return SITE_CONFIGURATIONS[site_key]
+
+    module_name = _MODULE_MAP.get(site_key)
+    if module_name is None:
+        return None
+
+    try:
+        # Import the module
+        module = importlib.import_module(f'.{module_name}', package='site_configs')
+
+        # Look for site configuration in the module
+        if hasattr(module, 'SITE_CONFIG'):
+            SITE_CONFIGURATIONS[site_key] = module.SITE_CONFIG
+            logger.debug(f"Loaded configuration for: {module.SITE_CONFIG.get('name', site_key)}")
+            return module.SITE_CONFIG
+
+    except Exception as e:
+        logger.warning(f"Could not load {module_name}: {str(e)}")
+
+    return None
 
 # Export configurations for easy import
+@functools.lru_cache(maxsize=None)
 def get_site_config(site_key):
-    """Get configuration for a specific site"""
-    return SITE_CONFIGURATIONS.get(site_key)
+    """Get a read-only view of the configuration for a specific site"""
+    config = _load_site_config(site_key)
+    if config is None:
+        return None
+    return MappingProxyType(config)
 
 def list_available_sites():
-    """List all available site configurations"""
-    return list(SITE_CONFIGURATIONS.keys())
+    """List all available site configurations without importing them"""
+    return list(_MODULE_MAP.keys())
 
 def get_all_configurations():
     """Get all site configurations"""
+    for site_key in _MODULE_MAP:
+        _load_site_config(site_key)
     return SITE_CONFIGURATIONS.copy()
 
 # For backward compatibility
-__all__ = ['SITE_CONFIGURATIONS', 'get_site_config', 'list_available_sites', 'get_all_configurations']
\ No newline at end of file
+__all__ = ['SITE_CONFIGURATIONS', 'get_site_config', 'list_available_sites', 'get_all_configurations']
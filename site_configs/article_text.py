@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+# Text helpers shared by the site configurations
+
+def lower_text(article):
+    """Get an article's lowercased title and summary, reusing the scraper's cached copy when there is one"""
+    if hasattr(article, 'lower_text'):
+        return article.lower_text()
+    return f"{article.get('title') or ''} {article.get('summary') or ''}".lower()
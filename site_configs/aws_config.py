@@ -4,6 +4,79 @@
 import datetime
 import re
 
+# Shared article helpers; the configs are top-level modules when config_manager runs as a script
+try:
+    from .article_text import lower_text
+except ImportError:
+    from article_text import lower_text
+
+# Patterns used by the AWS helpers, compiled once at import time
+_ISO_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{1,2}):(\d{1,2})(?:[+-]\d{2}:\d{2})?')
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+# Shapes of the less common date formats, with the strptime format for each
+_DATE_SHAPES = (
+    (re.compile(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{4}'), '%d %b %Y'),
+    (re.compile(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}'), '%B %d, %Y')
+)
+
+# Every format parse_aws_date accepts, tried in turn for strings that match no shape
+_DATE_FORMATS = ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%d', '%d %b %Y', '%B %d, %Y')
+
+_REGION_NAME_RE = re.compile(r'([A-Z][a-z]+(?:\s+[A-Za-z]+)*)\s+Region')
+_AWS_REGION_CODE_RE = re.compile(
+    r'(?:us-(?:east|west)|eu-(?:west|central|north)|ap-(?:northeast|southeast|south|east)'
+    r'|ca-central|sa-east|af-south|me-(?:south|central))-\d'
+)
+
+# Share link targets and the platform each one belongs to, in priority order
+_SHARE_MAP = {'facebook': 'Facebook', 'twitter': 'Twitter', 'linkedin': 'LinkedIn', 'mailto:': 'Email'}
+
+# AWS services looked for in article titles and summaries
+AWS_SERVICES = (
+    'EC2', 'S3', 'Lambda', 'RDS', 'CloudFormation', 'ECS', 'EKS', 'SQS', 'SNS',
+    'DynamoDB', 'CloudFront', 'Route 53', 'VPC', 'IAM', 'CloudWatch', 'Kinesis',
+    'Redshift', 'EMR', 'Glue', 'SageMaker', 'CodeDeploy', 'CodePipeline', 'CodeBuild'
+)
+
+# Keywords that place a blog post in each category, in reporting order.
+# Single words match whole words; phrases match anywhere in the text.
+CATEGORY_KEYWORDS = (
+    ('Service Announcement', ('launch', 'launches', 'launched', 'launching',
+                              'announce', 'announces', 'announced', 'announcing', 'announcement', 'announcements',
+                              'introduce', 'introduces', 'introduced', 'introducing',
+                              'new', 'newly', 'newer', 'newest', 'available')),
+    ('Regional News', ('region', 'regions', 'regional', 'availability zone', 'az', 'azs', 'data center')),
+    ('Security & Compliance', ('security', 'compliance', 'iam', 'secrets', 'kms')),
+    ('Pricing & Cost', ('pricing', 'cost', 'costs', 'billing', 'free tier', 'savings')),
+    ('Customer Story', ('customer', 'customers', 'case study', 'success story')),
+    ('Technical Deep Dive', ('architecture', 'best practices', 'migration', 'performance'))
+)
+
+# Words that mark a post as a region or feature announcement
+_REGION_WORDS = frozenset({'REGION', 'REGIONS', 'REGIONAL', 'AZ', 'AZS'})
+_REGION_PHRASES = ('AVAILABILITY ZONE',)
+_FEATURE_WORDS = frozenset({'LAUNCH', 'LAUNCHES', 'LAUNCHED', 'LAUNCHING',
+                            'ANNOUNCE', 'ANNOUNCES', 'ANNOUNCED', 'ANNOUNCING', 'ANNOUNCEMENT', 'ANNOUNCEMENTS',
+                            'INTRODUCE', 'INTRODUCES', 'INTRODUCED', 'INTRODUCING',
+                            'NEW', 'NEWLY', 'NEWER', 'NEWEST'})
+
+def _keyword_scanner(keywords):
+    """Compile keywords into one pattern that reports every occurrence, including overlapping ones"""
+    alternatives = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'(?=({alternatives}))')
+
+_WORD_RE = re.compile(r'[A-Za-z]+')
+_AWS_SERVICE_NAMES = {service.upper(): service for service in AWS_SERVICES}
+_AWS_SERVICE_RE = _keyword_scanner(_AWS_SERVICE_NAMES)
+
+# Category of each single-word keyword, and (phrase, category) pairs for the rest
+_CATEGORY_BY_WORD = {keyword: category for category, keywords in CATEGORY_KEYWORDS
+                     for keyword in keywords if ' ' not in keyword}
+_CATEGORY_PHRASES = tuple((keyword, category) for category, keywords in CATEGORY_KEYWORDS
+                          for keyword in keywords if ' ' in keyword)
+_CATEGORY_ORDER = tuple(category for category, _ in CATEGORY_KEYWORDS)
+
 # Main AWS Blog configuration
 SITE_CONFIG = {
     'name': 'AWS Blog',
@@ -19,7 +92,8 @@ SITE_CONFIG = {
         'image': '.lb-col.lb-mid-6.lb-tiny-24 img'
     },
     'remove_duplicates': True,
-    'timeout': 20
+    'timeout': 20,
+    'parser': 'lxml'
 }
 
 # Custom date parser for AWS Blog
@@ -28,30 +102,27 @@ def parse_aws_date(date_str):
     if not date_str:
         return None
     
-    # AWS uses format like "2025-05-07T06:34:48-07:00"
-    try:
-        # Clean up the datetime string if it has timezone offset
-        if re.match(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}', date_str):
-            # Remove timezone offset for parsing
-            clean_date = re.sub(r'[+-]\d{2}:\d{2}$', '', date_str)
-            dt = datetime.datetime.strptime(clean_date, '%Y-%m-%dT%H:%M:%S')
-            return dt.isoformat()
-    except:
-        pass
+    # AWS uses format like "2025-05-07T06:34:48-07:00"; the timezone offset is dropped
+    match = _ISO_RE.fullmatch(date_str) or _ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        try:
+            return datetime.datetime(*map(int, match.groups())).isoformat()
+        except ValueError:
+            return date_str
     
-    # Try other formats if needed
-    formats = [
-        '%Y-%m-%dT%H:%M:%S',
-        '%Y-%m-%d',
-        '%d %b %Y',
-        '%B %d, %Y'
-    ]
+    # Try the format the string looks like first
+    for shape, fmt in _DATE_SHAPES:
+        if shape.fullmatch(date_str):
+            try:
+                return datetime.datetime.strptime(date_str, fmt).isoformat()
+            except ValueError:
+                break
     
-    for fmt in formats:
+    # Fall back to trying every format, which strptime accepts more loosely than the shapes
+    for fmt in _DATE_FORMATS:
         try:
-            dt = datetime.datetime.strptime(date_str, fmt)
-            return dt.isoformat()
-        except:
+            return datetime.datetime.strptime(date_str, fmt).isoformat()
+        except ValueError:
             continue
     
     # Return as-is if we can't parse it
@@ -74,49 +145,47 @@ def process_aws_article(article, container):
     if share_links:
         social_platforms = []
         for link in share_links:
-            if 'facebook' in link.get('href', ''):
-                social_platforms.append('Facebook')
-            elif 'twitter' in link.get('href', ''):
-                social_platforms.append('Twitter')
-            elif 'linkedin' in link.get('href', ''):
-                social_platforms.append('LinkedIn')
-            elif 'mailto:' in link.get('href', ''):
-                social_platforms.append('Email')
+            # The first target in priority order wins, wherever it appears in the URL
+            href = link.get('href', '')
+            platform = next((platform for target, platform in _SHARE_MAP.items() if target in href), None)
+            if platform:
+                social_platforms.append(platform)
         
         if social_platforms:
             article['social_sharing'] = social_platforms
     
-    # Extract AWS-specific metadata
-    # Check for AWS service mentions in title or summary
-    aws_services = [
-        'EC2', 'S3', 'Lambda', 'RDS', 'CloudFormation', 'ECS', 'EKS', 'SQS', 'SNS',
-        'DynamoDB', 'CloudFront', 'Route 53', 'VPC', 'IAM', 'CloudWatch', 'Kinesis',
-        'Redshift', 'EMR', 'Glue', 'SageMaker', 'CodeDeploy', 'CodePipeline', 'CodeBuild'
-    ]
-    
-    title_and_summary = f"{article.get('title', '')} {article.get('summary', '')}".upper()
-    mentioned_services = []
-    
-    for service in aws_services:
-        if service in title_and_summary:
-            mentioned_services.append(service)
-    
-    if mentioned_services:
-        article['aws_services'] = mentioned_services
-    
-    # Check for AWS Region announcements
-    if any(keyword in title_and_summary for keyword in ['REGION', 'AVAILABILITY ZONE', 'AZ']):
-        article['is_region_announcement'] = True
+    # Extract AWS-specific metadata, skipping the keyword checks for cards without text
+    title = article.get('title') or ''
+    summary = article.get('summary') or ''
+    if title or summary:
+        # Build the text, its upper-case form and its words once for every keyword check
+        raw = f"{title} {summary}"
+        up = raw.upper()
+        tokens = frozenset(_WORD_RE.findall(up))
         
-        # Try to extract region name
-        region_pattern = r'([A-Z][a-z]+(?:\s+[A-Za-z]+)*)\s+Region'
-        matches = re.findall(region_pattern, article.get('title', '') + article.get('summary', ''))
-        if matches:
-            article['aws_regions'] = list(set(matches))
-    
-    # Check for feature announcements
-    if any(keyword in title_and_summary for keyword in ['LAUNCH', 'ANNOUNCE', 'INTRODUCE', 'NEW']):
-        article['is_feature_announcement'] = True
+        # Check for AWS service mentions in title or summary with a single scan
+        found_services = {_AWS_SERVICE_NAMES[match] for match in _AWS_SERVICE_RE.findall(up)}
+        mentioned_services = [service for service in AWS_SERVICES if service in found_services]
+        
+        if mentioned_services:
+            article['aws_services'] = mentioned_services
+            service_categories = {_SERVICE_TO_CATEGORY[service] for service in mentioned_services
+                                  if service in _SERVICE_TO_CATEGORY}
+            if service_categories:
+                article['aws_service_categories'] = sorted(service_categories)
+        
+        # Check for AWS Region announcements
+        if _REGION_WORDS & tokens or any(phrase in up for phrase in _REGION_PHRASES):
+            article['is_region_announcement'] = True
+            
+            # Try to extract region name
+            matches = _REGION_NAME_RE.findall(raw)
+            if matches:
+                article['aws_regions'] = list(set(matches))
+        
+        # Check for feature announcements
+        if _FEATURE_WORDS & tokens:
+            article['is_feature_announcement'] = True
     
     # Extract additional metadata from footer
     footer = container.select_one('.blog-post-meta')
@@ -155,63 +224,61 @@ SITE_CONFIG['post_process'] = process_aws_article
 
 # Alternative selectors for AWS (in case main ones change)
 ALTERNATIVE_SELECTORS = {
-    'article_container': [
+    'article_container': (
         '.lb-row.lb-snap',
         '.blog-post-container',
         '.aws-blog-post',
         '.lb-post-item'
-    ],
-    'title': [
+    ),
+    'title': (
         'h2.blog-post-title span[property="name headline"]',
         'h2.blog-post-title a',
         '.lb-bold.blog-post-title',
         'h2'
-    ],
-    'link': [
+    ),
+    'link': (
         'h2.blog-post-title a[property="url"]',
         'a[property="url"][rel="bookmark"]',
         '.blog-post-title a'
-    ],
-    'summary': [
+    ),
+    'summary': (
         '.blog-post-excerpt p',
         '.blog-post-excerpt',
         'section[property="description"] p',
         '.lb-rtxt p'
-    ],
-    'date': [
+    ),
+    'date': (
         'time[property="datePublished"]',
         '.blog-post-meta time',
         '.blog-post-date',
         'time'
-    ]
+    )
+}
+
+# Fallbacks the scraper tries, in order, when a field's configured selectors miss.
+# Only narrow selectors are listed; the link falls back to the title's own anchor.
+SITE_CONFIG['fallback_selectors'] = {
+    'title': (
+        'h2.blog-post-title span[property="name headline"]',
+        'h2.blog-post-title a',
+        '.lb-bold.blog-post-title'
+    ),
+    'link': 'same_as_title',
+    'summary': (
+        '.blog-post-excerpt',
+        'section[property="description"] p'
+    ),
+    'date': (
+        '.blog-post-meta time',
+        '.blog-post-date'
+    )
 }
 
 # AWS-specific utility functions
 def extract_aws_regions(text):
     """Extract AWS region names from text"""
-    region_patterns = [
-        r'us-east-\d',
-        r'us-west-\d',
-        r'eu-west-\d',
-        r'eu-central-\d',
-        r'ap-northeast-\d',
-        r'ap-southeast-\d',
-        r'ap-south-\d',
-        r'ca-central-\d',
-        r'sa-east-\d',
-        r'af-south-\d',
-        r'me-south-\d',
-        r'ap-east-\d',
-        r'eu-north-\d',
-        r'me-central-\d'
-    ]
-    
-    regions = []
-    for pattern in region_patterns:
-        matches = re.findall(pattern, text.lower())
-        regions.extend(matches)
-    
-    return list(set(regions))
+    # One pass over the text with a single pattern covering every region prefix
+    return list(set(_AWS_REGION_CODE_RE.findall(text.lower())))
 
 def get_aws_blog_feed_url():
     """Get AWS blog RSS feed URL"""
@@ -219,35 +286,19 @@ def get_aws_blog_feed_url():
 
 def categorize_aws_blog_post(article):
     """Categorize AWS blog post based on content"""
-    title_summary = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-    
-    categories = []
-    
-    # Service announcements
-    if any(word in title_summary for word in ['launch', 'announce', 'introduce', 'new', 'available']):
-        categories.append('Service Announcement')
+    title = article.get('title') or ''
+    summary = article.get('summary') or ''
+    if not title and not summary:
+        return []
     
-    # Regional news
-    if any(word in title_summary for word in ['region', 'availability zone', 'az', 'data center']):
-        categories.append('Regional News')
+    title_summary = lower_text(article)
     
-    # Security and compliance
-    if any(word in title_summary for word in ['security', 'compliance', 'iam', 'secrets', 'kms']):
-        categories.append('Security & Compliance')
+    # Split the text into words once and map every keyword found straight to its category
+    words = frozenset(_WORD_RE.findall(title_summary))
+    found = {_CATEGORY_BY_WORD[word] for word in words & _CATEGORY_BY_WORD.keys()}
+    found.update(category for phrase, category in _CATEGORY_PHRASES if phrase in title_summary)
     
-    # Pricing and cost
-    if any(word in title_summary for word in ['pricing', 'cost', 'billing', 'free tier', 'savings']):
-        categories.append('Pricing & Cost')
-    
-    # Customer stories
-    if any(word in title_summary for word in ['customer', 'case study', 'success story']):
-        categories.append('Customer Story')
-    
-    # Technical deep dives
-    if any(word in title_summary for word in ['architecture', 'best practices', 'migration', 'performance']):
-        categories.append('Technical Deep Dive')
-    
-    return categories
+    return [category for category in _CATEGORY_ORDER if category in found]
 
 # AWS service categories
 AWS_SERVICE_CATEGORIES = {
@@ -262,6 +313,10 @@ AWS_SERVICE_CATEGORIES = {
     'Management': ['CloudWatch', 'CloudFormation', 'Systems Manager', 'Organizations', 'Config']
 }
 
+# Category of each service, for direct lookups
+_SERVICE_TO_CATEGORY = {service: category for category, services in AWS_SERVICE_CATEGORIES.items()
+                        for service in services}
+
 # Export the configuration
 if __name__ == "__main__":
     # Print configuration summary when run directly
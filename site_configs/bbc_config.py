@@ -2,6 +2,7 @@
 # BBC News configuration
 
 import datetime
+import re
 
 # Main BBC configuration
 SITE_CONFIG = {
@@ -18,65 +19,67 @@ SITE_CONFIG = {
         'image': 'img'
     },
     'remove_duplicates': True,
-    'timeout': 20
+    'timeout': 20,
+    'parser': 'lxml'
 }
 
+# Relative BBC dates such as "2 hrs ago", and the length of each unit
+_BBC_REL_RE = re.compile(r'^(\d+)\s+(hr|hrs|min|mins|day|days)\s+ago$')
+_HOUR = datetime.timedelta(hours=1)
+_MINUTE = datetime.timedelta(minutes=1)
+_DAY = datetime.timedelta(days=1)
+_UNIT = {'hr': _HOUR, 'hrs': _HOUR, 'min': _MINUTE, 'mins': _MINUTE, 'day': _DAY, 'days': _DAY}
+
 # Custom date parser for BBC
-def parse_bbc_date(date_str):
-    """Parse BBC's specific date format"""
+def parse_bbc_date(date_str, now=None):
+    """Parse BBC's specific date format
+    
+    Pass ``now`` to share one reference time across a whole scrape.
+    """
     if not date_str:
         return None
     
     date_str = date_str.lower().strip()
-    now = datetime.datetime.now()
     
-    if 'hrs ago' in date_str or 'hr ago' in date_str:
-        # Extract hours
-        try:
-            hours = int(date_str.split()[0])
-            return (now - datetime.timedelta(hours=hours)).isoformat()
-        except:
-            pass
-    elif 'mins ago' in date_str or 'min ago' in date_str:
-        # Extract minutes
-        try:
-            minutes = int(date_str.split()[0])
-            return (now - datetime.timedelta(minutes=minutes)).isoformat()
-        except:
-            pass
-    elif 'days ago' in date_str or 'day ago' in date_str:
-        # Extract days
-        try:
-            days = int(date_str.split()[0])
-            return (now - datetime.timedelta(days=days)).isoformat()
-        except:
-            pass
+    match = _BBC_REL_RE.match(date_str)
+    if match:
+        now = now or datetime.datetime.now()
+        return (now - _UNIT[match.group(2)] * int(match.group(1))).isoformat()
     elif 'yesterday' in date_str:
-        return (now - datetime.timedelta(days=1)).isoformat()
+        return ((now or datetime.datetime.now()) - _DAY).isoformat()
     elif 'today' in date_str:
-        return now.isoformat()
+        return (now or datetime.datetime.now()).isoformat()
     
     # Return as-is if we can't parse it
     return date_str
 
+# Card indicators, matched by class or data-testid in a single select
+_BBC_INDICATORS = ('live-tag', 'video-icon', 'audio-icon')
+_BBC_INDICATOR_SEL = ', '.join(f'.{name}, [data-testid="{name}"]' for name in _BBC_INDICATORS)
+
 # Custom post-processor for BBC articles
 def process_bbc_article(article, container):
     """Add BBC-specific post-processing"""
     
+    # Find the live, video and audio indicators in one pass over the card
+    indicators = {}
+    for element in container.select(_BBC_INDICATOR_SEL):
+        for name in (element.get('data-testid'), *element.get('class', [])):
+            if name in _BBC_INDICATORS:
+                indicators.setdefault(name, element)
+    
     # Check for live coverage indicator
-    live_tag = container.select_one('.live-tag, [data-testid="live-tag"]')
+    live_tag = indicators.get('live-tag')
     if live_tag:
         article['is_live'] = True
         article['live_text'] = live_tag.get_text().strip()
     
     # Check for video indicator
-    video_indicator = container.select_one('.video-icon, [data-testid="video-icon"]')
-    if video_indicator:
+    if 'video-icon' in indicators:
         article['has_video'] = True
     
     # Check for audio indicator
-    audio_indicator = container.select_one('.audio-icon, [data-testid="audio-icon"]')
-    if audio_indicator:
+    if 'audio-icon' in indicators:
         article['has_audio'] = True
     
     # Extract additional metadata
@@ -99,34 +102,68 @@ SITE_CONFIG['post_process'] = process_bbc_article
 
 # Alternative selectors for BBC (in case the main ones change)
 ALTERNATIVE_SELECTORS = {
-    'article_container': [
+    'article_container': (
         'div[data-testid="dundee-card"]',
         '.gs-c-promo',
         '.nw-c-promo',
         '.media-list__item'
-    ],
-    'title': [
+    ),
+    'title': (
         'h2[data-testid="card-headline"]',
         '.gs-c-promo-heading__title',
         '.nw-o-link-split__text',
         'h3'
-    ],
-    'link': [
+    ),
+    'link': (
         'a[data-testid="internal-link"]',
         'a.gs-c-promo-heading',
         'a.nw-o-link-split__anchor'
-    ],
-    'summary': [
+    ),
+    'summary': (
         'p[data-testid="card-description"]',
         '.gs-c-promo-summary',
         '.nw-c-promo-summary'
-    ],
-    'date': [
+    ),
+    'date': (
         'span[data-testid="card-metadata-lastupdated"]',
         'time',
         '.gs-c-promo-date',
         '.date'
-    ]
+    )
+}
+
+# Fallbacks the scraper tries, in order, when a field's configured selectors miss.
+# Only narrow selectors are listed; the link falls back to the title's own anchor.
+SITE_CONFIG['fallback_selectors'] = {
+    'title': (
+        '.gs-c-promo-heading__title',
+        '.nw-o-link-split__text'
+    ),
+    'link': 'same_as_title',
+    'summary': (
+        '.gs-c-promo-summary',
+        '.nw-c-promo-summary'
+    ),
+    'date': (
+        '.gs-c-promo-date',
+    )
+}
+
+# Words in a title or category that mark breaking news
+_BREAKING = ('breaking', 'urgent', 'alert', 'live')
+
+# Paths of the BBC sections, relative to the site root
+_SECTION_PATHS = {
+    'world': '/news/world',
+    'uk': '/news/uk',
+    'business': '/news/business',
+    'politics': '/news/politics',
+    'tech': '/news/technology',
+    'science': '/news/science-environment',
+    'health': '/news/health',
+    'education': '/news/education',
+    'entertainment': '/news/entertainment-arts',
+    'sport': '/sport'
 }
 
 # BBC-specific utility functions
@@ -135,9 +172,7 @@ def is_breaking_news(article):
     title = article.get('title', '').lower()
     category = article.get('category', '').lower()
     
-    breaking_indicators = ['breaking', 'urgent', 'alert', 'live']
-    
-    for indicator in breaking_indicators:
+    for indicator in _BREAKING:
         if indicator in title or indicator in category:
             return True
     
@@ -147,20 +182,7 @@ def get_bbc_section_url(section):
     """Generate BBC section URLs"""
     base_url = "https://www.bbc.com"
     
-    section_paths = {
-        'world': '/news/world',
-        'uk': '/news/uk',
-        'business': '/news/business',
-        'politics': '/news/politics',
-        'tech': '/news/technology',
-        'science': '/news/science-environment',
-        'health': '/news/health',
-        'education': '/news/education',
-        'entertainment': '/news/entertainment-arts',
-        'sport': '/sport'
-    }
-    
-    return base_url + section_paths.get(section.lower(), '/news')
+    return base_url + _SECTION_PATHS.get(section.lower(), '/news')
 
 # Export the configuration
 if __name__ == "__main__":
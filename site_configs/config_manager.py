@@ -2,50 +2,145 @@
 # Configuration manager for easily handling multiple site configs
 
 import os
-import json
+import sys
+import importlib
+import importlib.util
+import pkgutil
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Use orjson for config exports when it is installed
+try:
+    import orjson
+    
+    def _json_dumps(obj, pretty=True):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    import json
+    
+    def _json_dumps(obj, pretty=True):
+        if pretty:
+            return json.dumps(obj, indent=2).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Config keys that hold functions and can't be saved to JSON
+_NON_SERIAL = frozenset({'date_parser', 'post_process'})
+
+def _intern_selector(selector):
+    """Intern a selector string, or each string of a selector list, so sites share them"""
+    if isinstance(selector, str):
+        return sys.intern(selector)
+    if isinstance(selector, (list, tuple)):
+        return tuple(sys.intern(item) for item in selector)
+    return selector
+
+def _intern_selectors(config):
+    """Get a copy of a configuration with its container and field selectors interned"""
+    config = dict(config)
+    if 'article_container' in config:
+        config['article_container'] = _intern_selector(config['article_container'])
+    if 'selectors' in config:
+        config['selectors'] = {key: _intern_selector(selector) for key, selector in config['selectors'].items()}
+    return config
+
+def _css_selectors(config):
+    """Yield every CSS selector string in a configuration"""
+    def expand(selector):
+        if isinstance(selector, str):
+            return () if selector == 'same_as_title' else (selector,)
+        if isinstance(selector, (list, tuple)):
+            return selector
+        if isinstance(selector, dict) and 'css' in selector:
+            return expand(selector['css'])
+        return ()
+    
+    yield from expand(config.get('article_container'))
+    for selector in config.get('selectors', {}).values():
+        yield from expand(selector)
+    for fallbacks in config.get('fallback_selectors', {}).values():
+        yield from expand(fallbacks)
+
 class ConfigManager:
     """Manages site configurations for the news scraper"""
     
     def __init__(self, config_dir=None):
-        self.config_dir = config_dir or os.path.dirname(os.path.abspath(__file__))
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        self.config_dir = config_dir or package_dir
+        # Configs outside the package directory are loaded straight from their files
+        self._in_package = os.path.abspath(self.config_dir) == package_dir
         self.configs = {}
-        self.load_all_configs()
+        # JSON-serializable views of loaded configs, keyed by the config's id
+        self._json_cache = {}
+        # Find the available sites without importing them; configs load on first use
+        self._available = {name[:-len('_config')] for _, name, _ in pkgutil.iter_modules([self.config_dir])
+                           if name.endswith('_config')}
     
     def load_all_configs(self):
         """Load all site configurations from the config directory"""
-        config_files = [f for f in os.listdir(self.config_dir) 
-                       if f.endswith('_config.py') and not f.startswith('__')]
-        
-        for config_file in config_files:
-            site_key = config_file.replace('_config.py', '')
-            try:
-                # Import the module dynamically
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(
-                    site_key, 
-                    os.path.join(self.config_dir, config_file)
-                )
+        pending = [site_key for site_key in sorted(self._available) if site_key not in self.configs]
+        if pending:
+            # Config modules are independent, so their imports can overlap
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                for site_key, config in executor.map(self._load_one, pending):
+                    self.configs[site_key] = config
+        return self.configs
+    
+    def _load_one(self, site_key):
+        """Import a site's config module and return the site key with its configuration"""
+        try:
+            module_name = f'{site_key}_config'
+            if self._in_package:
+                # Run as a script, the config modules are importable at top level
+                module = importlib.import_module(f'{__package__}.{module_name}' if __package__ else module_name)
+            else:
+                spec = importlib.util.spec_from_file_location(module_name,
+                                                              os.path.join(self.config_dir, f'{module_name}.py'))
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
-                
-                if hasattr(module, 'SITE_CONFIG'):
-                    self.configs[site_key] = module.SITE_CONFIG
-                    print(f"Loaded config for: {module.SITE_CONFIG.get('name', site_key)}")
-            
-            except Exception as e:
-                print(f"Error loading {config_file}: {str(e)}")
+            config = getattr(module, 'SITE_CONFIG', None)
+            if config is not None:
+                config = _intern_selectors(config)
+                logger.debug(f"Loaded config for: {config.get('name', site_key)}")
+            return site_key, config
+        
+        except Exception as e:
+            logger.warning(f"Error loading {site_key}_config.py: {str(e)}")
+            return site_key, None
     
     def get_config(self, site_key):
-        """Get configuration for a specific site"""
-        return self.configs.get(site_key)
+        """Get configuration for a specific site, importing it on first access"""
+        if site_key not in self.configs:
+            if site_key not in self._available:
+                return None
+            
+            self.configs[site_key] = self._load_one(site_key)[1]
+        
+        return self.configs[site_key]
     
     def list_sites(self):
         """List all available sites"""
-        return list(self.configs.keys())
+        return sorted(self._available)
+    
+    def _serializable(self, config):
+        """Get a cached copy of a configuration without its non-serializable items"""
+        key = id(config)
+        view = self._json_cache.get(key)
+        if view is None:
+            view = self._json_cache[key] = {k: v for k, v in config.items()
+                                            if not callable(v) and k not in _NON_SERIAL}
+        return view
     
-    def save_config_to_json(self, site_key, output_file=None):
+    def _dump_json(self, data, output_file, pretty):
+        """Write data to a JSON file, indented for editing or compact when pretty is False"""
+        with open(output_file, 'wb') as f:
+            f.write(_json_dumps(data, pretty))
+    
+    def save_config_to_json(self, site_key, output_file=None, pretty=True):
         """Save a specific site's configuration to JSON"""
         config = self.get_config(site_key)
         if not config:
@@ -55,27 +150,16 @@ class ConfigManager:
         if not output_file:
             output_file = f"{site_key}_config.json"
         
-        # Remove non-serializable items (functions)
-        json_config = {k: v for k, v in config.items() 
-                      if not callable(v) and k not in ['date_parser', 'post_process']}
-        
-        with open(output_file, 'w') as f:
-            json.dump(json_config, f, indent=2)
+        self._dump_json(self._serializable(config), output_file, pretty)
         
         print(f"Saved {site_key} configuration to {output_file}")
     
-    def save_all_configs_to_json(self, output_file='all_configs.json'):
+    def save_all_configs_to_json(self, output_file='all_configs.json', pretty=True):
         """Save all configurations to a single JSON file"""
-        all_configs = {}
-        
-        for site_key, config in self.configs.items():
-            # Remove non-serializable items
-            json_config = {k: v for k, v in config.items() 
-                          if not callable(v) and k not in ['date_parser', 'post_process']}
-            all_configs[site_key] = json_config
+        all_configs = {site_key: self._serializable(config)
+                       for site_key, config in self.load_all_configs().items() if config}
         
-        with open(output_file, 'w') as f:
-            json.dump(all_configs, f, indent=2)
+        self._dump_json(all_configs, output_file, pretty)
         
         print(f"Saved all configurations to {output_file}")
     
@@ -101,7 +185,8 @@ SITE_CONFIG = {{
         'image': 'img'  # Update with actual selector
     }},
     'remove_duplicates': True,
-    'timeout': 20
+    'timeout': 20,
+    'parser': 'lxml'
 }}
 
 # Custom date parser for {site_name}
@@ -143,6 +228,9 @@ if __name__ == "__main__":
         with open(config_file, 'w') as f:
             f.write(template)
         
+        importlib.invalidate_caches()
+        self._available.add(site_key)
+        
         print(f"Created new configuration template: {config_file}")
         print("Please update the selectors with actual values from the website")
     
@@ -172,6 +260,14 @@ if __name__ == "__main__":
         if 'url' in config and not config['url'].startswith(('http://', 'https://')):
             errors.append("URL must start with http:// or https://")
         
+        # Check that every selector compiles
+        import soupsieve
+        for selector in _css_selectors(config):
+            try:
+                soupsieve.compile(selector)
+            except soupsieve.SelectorSyntaxError as e:
+                errors.append(f"Invalid selector {selector!r}: {str(e).splitlines()[0]}")
+        
         if errors:
             return False, "\\n".join(errors)
         else:
@@ -207,27 +303,41 @@ Selectors:
         
         return summary
 
-# Global config manager instance
-config_manager = ConfigManager()
+# Global config manager instance, created on first use
+@functools.lru_cache(maxsize=None)
+def _mgr():
+    return ConfigManager()
+
+def __getattr__(name):
+    # Keep ``config_manager`` importable without building it at import time
+    if name == 'config_manager':
+        return _mgr()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Export functions for easy access
 def get_config(site_key):
     """Get configuration for a site"""
-    return config_manager.get_config(site_key)
+    return _mgr().get_config(site_key)
 
 def list_sites():
     """List all available sites"""
-    return config_manager.list_sites()
+    return _mgr().list_sites()
+
+def validate_config(site_key):
+    """Validate a site's configuration"""
+    return _mgr().validate_config(site_key)
 
 def create_new_site_config(site_key, site_name, site_url):
     """Create a new site configuration"""
-    return config_manager.create_new_config_template(site_key, site_name, site_url)
+    return _mgr().create_new_config_template(site_key, site_name, site_url)
 
 # Usage example
 if __name__ == "__main__":
     print("News Scraper Configuration Manager")
     print("=" * 40)
     
+    config_manager = _mgr()
+    
     # List all available sites
     print("\\nAvailable sites:")
     for site in config_manager.list_sites():
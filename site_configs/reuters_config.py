@@ -4,6 +4,68 @@
 import datetime
 import re
 
+# Shared article helpers; the configs are top-level modules when config_manager runs as a script
+try:
+    from .article_text import lower_text
+except ImportError:
+    from article_text import lower_text
+
+# Patterns used by the Reuters helpers, compiled once at import time
+# Every Reuters date shape in one pattern; the named group that matched tells them apart
+_DATE_RE = re.compile(
+    r'(?P<iso>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:Z|[+-]\d{2}:\d{2})$'
+    r'|(?P<ago_val>\d+)\s*(?P<ago_unit>minute|hour|day)s?\s*ago'
+    r'|(?P<mon>[A-Za-z]+)\s+(?P<day>\d{1,2}),\s+(?P<year>\d{4})\s+·\s+(?P<time>\d{1,2}:\d{2})\s+(?P<ap>AM|PM)\s+\w+',
+    re.IGNORECASE
+)
+
+# Runs of 2-5 capitals that may be stock symbols, and common words that aren't
+_STOCK_RE = re.compile(r'\b[A-Z]{2,5}\b')
+_COMMON_WORDS = frozenset({'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'WERE', 'HER', 'SHE', 'HIM', 'HIS', 'HAS', 'HAD', 'CAN', 'WAS'})
+
+def _keyword_scanner(keywords):
+    """Compile keywords into one pattern that reports every occurrence, including overlapping ones"""
+    alternatives = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+    return re.compile(f'(?=({alternatives}))')
+
+# Elements process_reuters_article looks for in a card
+_CARD_TAGS = ('svg', 'img', 'span', 'a')
+
+# Words that mark an article, or its card text, as breaking news
+_BREAKING_RE = re.compile('breaking|urgent|developing|flash|alert')
+_CARD_BREAKING_RE = re.compile('breaking|flash|urgent')
+
+# Keywords that place an article in each category, in reporting order
+CATEGORY_KEYWORDS = (
+    ('Markets & Finance', ('stock', 'market', 'trading', 'investor', 'earnings', 'wall street', 'shares')),
+    ('Technology', ('tech', 'startup', 'ai', 'crypto', 'bitcoin', 'apple', 'google', 'microsoft')),
+    ('International', ('china', 'russia', 'europe', 'asia', 'middle east', 'diplomatic')),
+    ('Business', ('merger', 'acquisition', 'ceo', 'earnings', 'revenue', 'profit')),
+    ('Politics', ('president', 'congress', 'senate', 'election', 'government', 'policy')),
+    ('Legal', ('court', 'lawsuit', 'judge', 'legal', 'trial', 'settlement')),
+    ('Exclusive', ('exclusive',))
+)
+
+# Categories of each keyword (a keyword can select several), and a scanner that finds them all at once
+_CATEGORIES_BY_KEYWORD = {
+    keyword: tuple(category for category, keywords in CATEGORY_KEYWORDS if keyword in keywords)
+    for _, keywords in CATEGORY_KEYWORDS for keyword in keywords
+}
+_CATEGORY_KEYWORD_RE = _keyword_scanner(_CATEGORIES_BY_KEYWORD)
+
+# Stock symbols with common exchanges, and price movements
+_EXCHANGE_RES = tuple(re.compile(pattern) for pattern in (
+    r'\((NYSE|NASDAQ|LSE|TSE):[A-Z]+\)',
+    r'\b([A-Z]{2,5})\.(N|O|L|T)\b'
+))
+_PRICE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\$\d+(?:\.\d{2})?',
+    r'up \d+(?:\.\d+)?%',
+    r'down \d+(?:\.\d+)?%',
+    r'rose \d+(?:\.\d+)?%',
+    r'fell \d+(?:\.\d+)?%'
+))
+
 # Main Reuters configuration
 SITE_CONFIG = {
     'name': 'Reuters',
@@ -19,7 +81,24 @@ SITE_CONFIG = {
         'image': '.media-story-card__image-container__gQPAN img'
     },
     'remove_duplicates': True,
-    'timeout': 20
+    'timeout': 20,
+    'parser': 'lxml'
+}
+
+# Length of each "... ago" unit
+_AGO_UNITS = {
+    'minute': datetime.timedelta(minutes=1),
+    'hour': datetime.timedelta(hours=1),
+    'day': datetime.timedelta(days=1)
+}
+
+# Month numbers by full and abbreviated name
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
 }
 
 # Custom date parser for Reuters
@@ -29,83 +108,37 @@ def parse_reuters_date(date_str):
         return None
     
     date_str = str(date_str).strip()
-    now = datetime.datetime.now()
     
-    # Handle ISO format with timezone (Reuters current format)
+    match = _DATE_RE.match(date_str)
+    if not match:
+        # Return as-is if we can't parse it
+        return date_str
+    
+    # ISO format with "Z" or a timezone offset (Reuters current format)
     # Example: "2025-05-09T09:21:23Z"
-    if re.match(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z', date_str):
+    if match.group('iso'):
         try:
-            # Remove 'Z' at the end and parse
-            clean_date = date_str.rstrip('Z')
-            dt = datetime.datetime.strptime(clean_date, '%Y-%m-%dT%H:%M:%S')
-            return dt.isoformat()
-        except:
-            pass
-    
-    # Handle ISO format with timezone offset
-    if re.match(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}', date_str):
-        try:
-            # Clean up timezone info
-            clean_date = re.sub(r'[+-]\d{2}:\d{2}$', '', date_str)
-            dt = datetime.datetime.strptime(clean_date, '%Y-%m-%dT%H:%M:%S')
-            return dt.isoformat()
-        except:
-            pass
+            return datetime.datetime.fromisoformat(match.group('iso')).isoformat()
+        except ValueError:
+            return date_str
     
     # Time ago format
-    if re.match(r'(\d+)\s*(minute|hour|day)s?\s*ago', date_str, re.IGNORECASE):
-        match = re.match(r'(\d+)\s*(minute|hour|day)s?\s*ago', date_str, re.IGNORECASE)
-        if match:
-            value = int(match.group(1))
-            unit = match.group(2).lower()
-            
-            if 'minute' in unit:
-                return (now - datetime.timedelta(minutes=value)).isoformat()
-            elif 'hour' in unit:
-                return (now - datetime.timedelta(hours=value)).isoformat()
-            elif 'day' in unit:
-                return (now - datetime.timedelta(days=value)).isoformat()
-    
-    # Time with timezone format (e.g., "5:21 AM EDT")
-    time_pattern = r'(?:May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}\s+·\s+(\d{1,2}:\d{2}\s+(?:AM|PM)\s+\w+)'
-    match = re.search(time_pattern, date_str)
-    if match:
-        # This is more complex - we'd need to parse the timezone and date
-        # For now, return the current date with extracted time info
-        return now.isoformat()
+    if match.group('ago_val'):
+        unit = _AGO_UNITS[match.group('ago_unit').lower()]
+        return (datetime.datetime.now() - unit * int(match.group('ago_val'))).isoformat()
     
-    # Month day, year format with time
+    # Month day, year format with time (timezone ignored for now)
     # Example: "May 9, 2025 · 5:21 AM EDT"
-    pattern = r'([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})\s+·\s+(\d{1,2}:\d{2})\s+(AM|PM)\s+(\w+)'
-    match = re.match(pattern, date_str)
-    if match:
+    month = _MONTHS.get(match.group('mon').lower())
+    hour, minute = map(int, match.group('time').split(':'))
+    if month and 1 <= hour <= 12:
+        # Convert the 12-hour clock to 24-hour
+        hour = hour % 12 + (12 if match.group('ap').upper() == 'PM' else 0)
         try:
-            month_name = match.group(1)
-            day = int(match.group(2))
-            year = int(match.group(3))
-            time_str = match.group(4)
-            am_pm = match.group(5)
-            timezone = match.group(6)
-            
-            # Convert month name to number
-            month_map = {
-                'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                'september': 9, 'october': 10, 'november': 11, 'december': 12,
-                'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
-                'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-            }
-            
-            month = month_map.get(month_name.lower())
-            if month:
-                # Create datetime object (ignoring timezone for now)
-                dt_str = f"{year}-{month:02d}-{day:02d} {time_str} {am_pm}"
-                dt = datetime.datetime.strptime(dt_str, '%Y-%m-%d %I:%M %p')
-                return dt.isoformat()
-        except:
+            return datetime.datetime(int(match.group('year')), month, int(match.group('day')), hour, minute).isoformat()
+        except ValueError:
             pass
     
-    # Return as-is if we can't parse it
     return date_str
 
 # Custom post-processor for Reuters articles
@@ -127,8 +160,22 @@ def process_reuters_article(article, container):
     if 'exclusive:' in title_text or 'exclusive ' in title_text:
         article['is_exclusive'] = True
     
+    # Collect the first of each element the checks below need in one pass over the card
+    video_indicator = image_elem = date_span = link_elem = None
+    for node in container.find_all(_CARD_TAGS):
+        if node.name == 'svg':
+            if video_indicator is None and node.find_parent(attrs={'data-testid': 'Media'}):
+                video_indicator = node
+        elif node.name == 'img':
+            if image_elem is None:
+                image_elem = node
+        elif node.name == 'span':
+            if date_span is None and node.get('data-testid') == 'Label':
+                date_span = node
+        elif link_elem is None and node.has_attr('aria-label'):
+            link_elem = node
+    
     # Extract video indicator
-    video_indicator = container.select_one('[data-testid="Media"] svg')
     if video_indicator:
         article['has_video'] = True
         # Try to get video metadata if available
@@ -137,7 +184,6 @@ def process_reuters_article(article, container):
             article['media_type'] = 'video'
     
     # Extract full image information
-    image_elem = container.select_one('img')
     if image_elem:
         # Get responsive image sources
         srcset = image_elem.get('srcset')
@@ -159,7 +205,6 @@ def process_reuters_article(article, container):
             article['image_alt'] = alt_text
     
     # Extract more detailed date information
-    date_span = container.select_one('span[data-testid="Label"]')
     if date_span:
         full_date_text = date_span.get_text()
         if ' · ' in full_date_text:
@@ -169,14 +214,13 @@ def process_reuters_article(article, container):
                 article['full_date_text'] = parts[1].strip()
     
     # Extract aria-label for additional context
-    link_elem = container.select_one('a[aria-label]')
     if link_elem:
         aria_label = link_elem.get('aria-label', '')
         if aria_label:
             article['aria_label'] = aria_label
     
-    # Check for breaking news indicators
-    if any(indicator in str(container).lower() for indicator in ['breaking', 'flash', 'urgent']):
+    # Check for breaking news indicators in the card's text
+    if _CARD_BREAKING_RE.search(container.get_text(' ').lower()):
         article['is_breaking'] = True
     
     # Extract section/category from URL
@@ -187,13 +231,11 @@ def process_reuters_article(article, container):
     
     # Extract company/stock references
     # Look for company names or stock symbols in title
-    stock_pattern = r'\b[A-Z]{1,5}\b'
     title_summary = f"{article.get('title', '')} {article.get('summary', '')}"
-    potential_stocks = re.findall(stock_pattern, title_summary)
+    potential_stocks = _STOCK_RE.findall(title_summary)
     if potential_stocks:
-        # Filter out common words that aren't stocks
-        common_words = {'THE', 'AND', 'FOR', 'ARE', 'BUT', 'NOT', 'YOU', 'ALL', 'WERE', 'HER', 'SHE', 'HIM', 'HIS', 'HAS', 'HAD', 'CAN', 'WAS'}
-        stocks = [s for s in potential_stocks if s not in common_words and len(s) >= 2]
+        # Filter out common words that aren't stocks, listing each symbol once in order of appearance
+        stocks = [s for s in dict.fromkeys(potential_stocks) if s not in _COMMON_WORDS]
         if stocks:
             article['mentioned_companies'] = stocks
     
@@ -205,37 +247,57 @@ SITE_CONFIG['post_process'] = process_reuters_article
 
 # Alternative selectors for Reuters (in case main ones change)
 ALTERNATIVE_SELECTORS = {
-    'article_container': [
+    'article_container': (
         'li.story-collection__list-item__j4SQe',
         '.story-card',
         '[data-testid="MediaStoryCard"]',
         '.media-story-card',
         '.story-collection__list-item'
-    ],
-    'title': [
+    ),
+    'title': (
         'h3[data-testid="Heading"] a',
         '.media-story-card__heading__eqhp9',
         '.story-card-heading__heading',
         '.article-heading',
         'h3 a'
-    ],
-    'link': [
+    ),
+    'link': (
         'h3[data-testid="Heading"] a[data-testid="Link"]',
         '.media-story-card__heading__eqhp9',
         'a[href^="/"]'
-    ],
-    'summary': [
+    ),
+    'summary': (
         'p[data-testid="Body"].media-story-card__description__2icjO',
         '.media-story-card__description',
         '.story-card-description',
         'p.description'
-    ],
-    'date': [
+    ),
+    'date': (
         'time[datetime]',
         'span[data-testid="Label"] time',
         '.story-card-timestamp',
         'time'
-    ]
+    )
+}
+
+# Fallbacks the scraper tries, in order, when a field's configured selectors miss.
+# Only narrow selectors are listed; the link falls back to the title's own anchor.
+SITE_CONFIG['fallback_selectors'] = {
+    'title': (
+        'h3[data-testid="Heading"] a',
+        '.media-story-card__heading__eqhp9',
+        '.story-card-heading__heading',
+        '.article-heading'
+    ),
+    'link': 'same_as_title',
+    'summary': (
+        '.media-story-card__description',
+        '.story-card-description'
+    ),
+    'date': (
+        'span[data-testid="Label"] time',
+        '.story-card-timestamp'
+    )
 }
 
 # Reuters-specific utility functions
@@ -271,26 +333,13 @@ def extract_market_symbols(article):
     # Look for stock symbols in title and summary
     text = f"{article.get('title', '')} {article.get('summary', '')}"
     
-    # Pattern for stock symbols with common exchanges
-    exchange_patterns = [
-        r'\((NYSE|NASDAQ|LSE|TSE):[A-Z]+\)',
-        r'\b([A-Z]{2,5})\.(N|O|L|T)\b'
-    ]
-    
-    for pattern in exchange_patterns:
-        symbols.extend(re.findall(pattern, text))
+    # Stock symbols with common exchanges
+    for pattern in _EXCHANGE_RES:
+        symbols.extend(pattern.findall(text))
     
     # Look for price movements
-    price_patterns = [
-        r'\$\d+(?:\.\d{2})?',
-        r'up \d+(?:\.\d+)?%',
-        r'down \d+(?:\.\d+)?%',
-        r'rose \d+(?:\.\d+)?%',
-        r'fell \d+(?:\.\d+)?%'
-    ]
-    
-    for pattern in price_patterns:
-        market_data.extend(re.findall(pattern, text, re.IGNORECASE))
+    for pattern in _PRICE_RES:
+        market_data.extend(pattern.findall(text))
     
     return {
         'symbols': list(set(symbols)),
@@ -299,65 +348,22 @@ def extract_market_symbols(article):
 
 def is_breaking_reuters(article):
     """Check if a Reuters article is breaking news"""
-    breaking_indicators = [
-        'breaking',
-        'urgent',
-        'developing',
-        'flash',
-        'alert'
-    ]
-    
-    title = article.get('title', '').lower()
-    summary = article.get('summary', '').lower()
-    
-    # Check title
-    for indicator in breaking_indicators:
-        if indicator in title:
-            return True
-    
-    # Check summary
-    for indicator in breaking_indicators:
-        if indicator in summary:
-            return True
+    # Check title and summary for any indicator in one scan
+    if _BREAKING_RE.search(lower_text(article)):
+        return True
     
     # Check if marked as breaking in metadata
     return article.get('is_breaking', False)
 
 def categorize_reuters_article(article):
     """Categorize Reuters articles based on content"""
-    title_summary = f"{article.get('title', '')} {article.get('summary', '')}".lower()
-    
-    categories = []
-    
-    # Market/Finance
-    if any(word in title_summary for word in ['stock', 'market', 'trading', 'investor', 'earnings', 'wall street', 'shares']):
-        categories.append('Markets & Finance')
-    
-    # Technology
-    if any(word in title_summary for word in ['tech', 'startup', 'ai', 'crypto', 'bitcoin', 'apple', 'google', 'microsoft']):
-        categories.append('Technology')
-    
-    # International News
-    if any(word in title_summary for word in ['china', 'russia', 'europe', 'asia', 'middle east', 'diplomatic']):
-        categories.append('International')
-    
-    # Business
-    if any(word in title_summary for word in ['merger', 'acquisition', 'ceo', 'earnings', 'revenue', 'profit']):
-        categories.append('Business')
-    
-    # Politics
-    if any(word in title_summary for word in ['president', 'congress', 'senate', 'election', 'government', 'policy']):
-        categories.append('Politics')
-    
-    # Legal
-    if any(word in title_summary for word in ['court', 'lawsuit', 'judge', 'legal', 'trial', 'settlement']):
-        categories.append('Legal')
-    
-    # Exclusive Content
-    if article.get('is_exclusive', False) or 'exclusive' in title_summary:
-        categories.append('Exclusive')
+    # Find every category keyword in a single scan of the text
+    found = {category for keyword in _CATEGORY_KEYWORD_RE.findall(lower_text(article))
+             for category in _CATEGORIES_BY_KEYWORD[keyword]}
+    if article.get('is_exclusive', False):
+        found.add('Exclusive')
     
-    return categories
+    return [category for category, _ in CATEGORY_KEYWORDS if category in found]
 
 # Reuters market coverage categories
 REUTERS_MARKET_CATEGORIES = {
@@ -3,34 +3,285 @@
 # Allows you to inject selectors for different websites
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter, Retry
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+import soupsieve
 import json
 import csv
 import os
 import datetime
 import time
 import re
-from urllib.parse import urljoin
+import functools
+import hashlib
+import inspect
+import tempfile
+import textwrap
+import operator
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urljoin, urlsplit
+
+# Browser-like headers sent with every request. Compressed responses are
+# accepted in every encoding urllib3 can decode here, including brotli when installed
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache'
+}
+
+# Seconds to wait for a connection; the read timeout comes from the site config
+CONNECT_TIMEOUT = 5
+
+# Parser used when a site doesn't configure one or its parser isn't installed,
+# and the built-in parser used when lxml isn't installed either
+DEFAULT_PARSER = 'lxml'
+FALLBACK_PARSER = 'html.parser'
+
+# Directory where all output files are written
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output')
+
+# Directory where fetched pages are cached between runs
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.news_cache')
+
+# Seconds a cached page is reused before it is fetched again
+DEFAULT_CACHE_TTL = 300
+
+# Units and number pattern for relative dates like "2 hours ago"
+_MINUTE = datetime.timedelta(minutes=1)
+_HOUR = datetime.timedelta(hours=1)
+_DAY = datetime.timedelta(days=1)
+_NUMBER_RE = re.compile(r'(\d+)')
+
+# Columns written to CSV output
+CSV_FIELDNAMES = ['title', 'link', 'summary', 'publish_date', 'category', 'author', 'image_url', 'source']
+
+@dataclass(slots=True)
+class Article:
+    """A scraped article with the common fields as slots and site-specific ones in ``extras``
+    
+    Supports the dict-style access (``article['title']``, ``article.get(...)``) used by
+    post-processors and callers; keys that aren't common fields are stored in ``extras``.
+    """
+    title: str
+    link: str
+    summary: str = ''
+    publish_date: Optional[str] = None
+    category: Optional[str] = None
+    author: Optional[str] = None
+    image_url: Optional[str] = None
+    source: str = ''
+    extras: dict = field(default_factory=dict)
+    _lower_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __getitem__(self, key):
+        if key in _ARTICLE_FIELD_SET:
+            return getattr(self, key)
+        return self.extras[key]
+    
+    def __setitem__(self, key, value):
+        if key in _ARTICLE_FIELD_SET:
+            setattr(self, key, value)
+        else:
+            self.extras[key] = value
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Changing the title or summary invalidates the cached lowercased text
+        if name in ('title', 'summary'):
+            object.__setattr__(self, '_lower_text', None)
+    
+    def __contains__(self, key):
+        return key in _ARTICLE_FIELD_SET or key in self.extras
+    
+    def get(self, key, default=None):
+        """Get a field or extra, or the default if the article doesn't have it"""
+        if key in _ARTICLE_FIELD_SET:
+            return getattr(self, key)
+        return self.extras.get(key, default)
+    
+    def lower_text(self):
+        """Get the lowercased title and summary, computed once and shared by the site helpers"""
+        if self._lower_text is None:
+            self._lower_text = f"{self.title or ''} {self.summary or ''}".lower()
+        return self._lower_text
+    
+    def to_dict(self):
+        """Get the article as a plain dict, common fields first, as written to JSON"""
+        data = {name: getattr(self, name) for name in CSV_FIELDNAMES}
+        data.update(self.extras)
+        return data
+
+_ARTICLE_FIELD_SET = frozenset(CSV_FIELDNAMES)
+
+def _json_default(obj):
+    """Serialize Article objects for json.dump"""
+    if isinstance(obj, Article):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# CSV values of an Article in CSV_FIELDNAMES order
+_ARTICLE_ROW = operator.attrgetter(*CSV_FIELDNAMES)
+
+def _csv_row(article):
+    """Get an article's CSV values in CSV_FIELDNAMES order"""
+    if isinstance(article, Article):
+        return _ARTICLE_ROW(article)
+    return [article.get(field, '') for field in CSV_FIELDNAMES]
+
+# Use orjson for writing article JSON when it is installed
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        # Pass Article through to _json_default so extras are written inline
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS)
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+def create_session(pool_size=32, retries=2):
+    """Create an HTTP session with pooled connections that can be shared across scrapers"""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    
+    # Reuse connections across requests and retry transient failures
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=retries, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def resolve_parser(parser):
+    """Return the requested BeautifulSoup parser if it is installed, else the fastest available one"""
+    for candidate in (parser, DEFAULT_PARSER):
+        if candidate and builder_registry.lookup(candidate) is not None:
+            return candidate
+    return FALLBACK_PARSER
+
+# A single compound selector such as 'li.story', '.a.b' or 'div[data-testid="card"]'
+_SIMPLE_SELECTOR_RE = re.compile(r'([a-zA-Z][\w-]*)?((?:\.[\w-]+)*)((?:\[[\w-]+(?:="[^"]*")?\])*)')
+_ATTRIBUTE_RE = re.compile(r'\[([\w-]+)(?:(=)"([^"]*)")?\]')
+
+def container_strainer(selector):
+    """Build a SoupStrainer that only keeps elements matching a simple container selector
+    
+    Returns None for selectors a strainer can't express, such as lists, combinators or pseudo-classes.
+    """
+    if not isinstance(selector, str):
+        return None
+    
+    match = _SIMPLE_SELECTOR_RE.fullmatch(selector.strip())
+    if not match or not any(match.groups()):
+        return None
+    
+    tag, class_text, attribute_text = match.groups()
+    attrs = {name.lower(): value if equals else True
+             for name, equals, value in _ATTRIBUTE_RE.findall(attribute_text)}
+    
+    classes = frozenset(class_text.split('.')[1:])
+    if classes:
+        if 'class' in attrs:
+            return None
+        attrs['class'] = lambda value: value is not None and classes <= set(
+            value.split() if isinstance(value, str) else value)
+    
+    return SoupStrainer(tag.lower() if tag else None, attrs=attrs)
+
+def _accepts_keyword(func, name):
+    """Check whether a callable accepts the given keyword argument"""
+    try:
+        parameters = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in parameters or any(p.kind == p.VAR_KEYWORD for p in parameters.values())
+
+@functools.lru_cache(maxsize=512)
+def compile_selector(selector):
+    """Compile a CSS selector once so identical selectors are shared across sites"""
+    return soupsieve.compile(selector)
+
+def compile_selectors(site_config):
+    """Pre-compile the article container and field selectors of a site configuration"""
+    compiled = {}
+    
+    container_selector = site_config.get('article_container')
+    if container_selector:
+        # Multiple container selectors are matched together in document order
+        if isinstance(container_selector, (list, tuple)):
+            container_selector = ', '.join(container_selector)
+        compiled['article_container'] = compile_selector(container_selector)
+    
+    for key, selector_config in site_config.get('selectors', {}).items():
+        if selector_config == 'same_as_title':
+            continue
+        if isinstance(selector_config, str):
+            compiled[key] = (compile_selector(selector_config),)
+        elif isinstance(selector_config, (list, tuple)):
+            compiled[key] = tuple(compile_selector(selector) for selector in selector_config)
+        # Advanced dict selectors are resolved by UniversalNewsScraper._make_finder
+    
+    # Sites can opt in to fallback selectors, tried one at a time in priority order when a
+    # field's configured selectors miss. Each is compiled on its own: a joined selector would
+    # return the first match in document order, which can be a lower-priority fallback.
+    for key, fallbacks in site_config.get('fallback_selectors', {}).items():
+        if key != 'article_container' and key in compiled and not isinstance(fallbacks, str):
+            configured = site_config['selectors'][key]
+            configured = (configured,) if isinstance(configured, str) else tuple(configured)
+            compiled[key] += tuple(compile_selector(selector) for selector in fallbacks
+                                   if selector not in configured)
+    
+    return compiled
 
 class UniversalNewsScraper:
     """Universal news scraper that accepts selector configurations for different websites"""
     
-    def __init__(self, site_config, verbose=True):
+    def __init__(self, site_config, verbose=True, session=None, cache_ttl=0, debug=False):
         self.site_config = site_config
         self.verbose = verbose
-        self.session = requests.Session()
+        self.debug = debug or site_config.get('save_debug_html', False)
+        self.session = session or create_session()
+        self.cache_ttl = cache_ttl
+        
+        # Pick the HTML parser once, falling back when the configured one is missing
+        self.parser = resolve_parser(site_config.get('parser'))
+        
+        # Custom date parsers that accept 'now' share one reference time per scrape
+        date_parser = site_config.get('date_parser')
+        self._date_parser_takes_now = bool(date_parser) and _accepts_keyword(date_parser, 'now')
+        
+        # Site root for making root-relative links absolute without urljoin
+        base = urlsplit(site_config['url'])
+        self._scheme_netloc = f"{base.scheme}://{base.netloc}"
+        
+        # Only build the page's article containers when the container selector allows it.
+        # Links found through the title's parent anchor need the rest of the page.
+        self._strainer = None
+        if site_config.get('selectors', {}).get('link') != 'same_as_title':
+            self._strainer = container_strainer(site_config.get('article_container'))
+        
+        # Compile selectors once instead of re-parsing them for every container
+        self.compiled_selectors = compile_selectors(site_config)
         
-        # Set browser-like headers
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache'
-        })
+        # Sites may opt in to taking the title's anchor when the link selectors miss
+        self._link_falls_back_to_title = site_config.get('fallback_selectors', {}).get('link') == 'same_as_title'
+        
+        # Resolve each field's selectors into a finder up front so extraction makes one call per field
+        self._finders = {key: self._make_finder(key)
+                         for key, selector_config in site_config.get('selectors', {}).items()
+                         if selector_config != 'same_as_title'}
         
         # Create output directory
-        self.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output')
+        self.output_dir = OUTPUT_DIR
         os.makedirs(self.output_dir, exist_ok=True)
     
     def log(self, message):
@@ -39,72 +290,151 @@ class UniversalNewsScraper:
             print(f"[{self.site_config['name']}] [{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] {message}")
 
     def save_html(self, html):
-        """Save raw HTML for debugging"""
+        """Save raw HTML bytes for debugging"""
         filename = f"{self.site_config['name'].lower().replace(' ', '_')}_debug.html"
         filepath = os.path.join(self.output_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
+        with open(filepath, 'wb') as f:
             f.write(html)
         self.log(f"Saved raw HTML to {filepath}")
         return filepath
 
+    def _cache_path(self, url):
+        """Get the cache file path for a URL"""
+        return os.path.join(CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.page')
+
+    def _read_cache(self, url):
+        """Return the cached HTML bytes and encoding for a URL if it is younger than the cache TTL"""
+        if not self.cache_ttl:
+            return None
+        
+        filepath = self._cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(filepath) > self.cache_ttl:
+                return None
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        # The first line holds the charset the server declared, if any
+        encoding, _, html = data.partition(b'\n')
+        return html, encoding.decode('ascii') or None
+
+    def _write_cache(self, url, html, encoding):
+        """Store fetched HTML bytes and their declared encoding in the cache"""
+        if not self.cache_ttl:
+            return
+        
+        # A failed cache write only costs the cache; the fetched page is still used
+        temp_path = None
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            filepath = self._cache_path(url)
+            
+            # Write to a temporary file first so concurrent readers never see partial pages
+            fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write((encoding or '').encode('ascii') + b'\n')
+                f.write(html)
+            os.replace(temp_path, filepath)
+        except OSError as e:
+            self.log(f"Could not cache page: {str(e)}")
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+
+    def fetch_html(self):
+        """Fetch the site's page as bytes, reusing a fresh cached copy when there is one
+        
+        Returns the page and the charset declared by the server, or None to let the parser detect it.
+        """
+        url = self.site_config['url']
+        
+        cached = self._read_cache(url)
+        if cached is not None:
+            self.log("Using cached page")
+            return cached
+        
+        timeout = (CONNECT_TIMEOUT, self.site_config.get('timeout', 20))
+        response = self.session.get(url, timeout=timeout)
+        response.raise_for_status()
+        
+        # Keep the raw bytes; the parser decodes them itself, using the meta tag when no charset is sent
+        html = response.content
+        encoding = None
+        if 'charset' in response.headers.get('content-type', '').lower():
+            encoding = response.encoding
+        self._write_cache(url, html, encoding)
+        return html, encoding
+
     def scrape_news(self):
         """Scrape news using the provided selector configuration"""
         self.log(f"Fetching news from: {self.site_config['url']}")
         
         try:
             # Fetch the webpage
-            response = self.session.get(self.site_config['url'], timeout=20)
-            response.raise_for_status()
-            
-            # Save HTML for debugging
-            html = response.text
-            self.save_html(html)
-            
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Extract articles using the configured selectors
-            articles = []
-            
-            # Find all article containers
-            article_containers = soup.select(self.site_config['article_container'])
-            self.log(f"Found {len(article_containers)} article containers")
+            html, encoding = self.fetch_html()
             
-            for container in article_containers:
-                try:
-                    article = self._extract_article_from_container(container)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    self.log(f"Error extracting article: {str(e)}")
-            
-            # Remove duplicates based on URL if specified
-            if self.site_config.get('remove_duplicates', True):
-                unique_articles = []
-                seen_urls = set()
-                
-                for article in articles:
-                    if article['link'] not in seen_urls:
-                        seen_urls.add(article['link'])
-                        unique_articles.append(article)
-                
-                articles = unique_articles
+            # Save HTML for debugging only when asked, since it costs a full page write per scrape
+            if self.debug:
+                self.save_html(html)
             
-            self.log(f"Total articles found: {len(articles)}")
-            
-            return articles
+            # Hand the page over to the parser without keeping the bytes alive during extraction
+            soup = self._make_soup(html, encoding)
+            del html
+            return self._parse_html(soup)
         
         except Exception as e:
             self.log(f"Error scraping news: {str(e)}")
             return []
     
-    def _extract_article_from_container(self, container):
-        """Extract article information from a container using configuration"""
+    def _make_soup(self, html, encoding=None):
+        """Parse HTML with BeautifulSoup, skipping everything outside the containers when possible"""
+        return BeautifulSoup(html, self.parser, from_encoding=encoding, parse_only=self._strainer)
+    
+    def _parse_html(self, soup):
+        """Extract articles from a parsed page using the configured selectors"""
+        # Extract articles using the configured selectors
+        articles = []
+        
+        # Find all article containers
+        article_containers = self.compiled_selectors['article_container'].select(soup)
+        self.log(f"Found {len(article_containers)} article containers")
+        
+        # Use one reference time for all relative dates on the page
+        now = datetime.datetime.now()
+        
+        # Skip duplicates based on URL if specified, before the rest of the card is extracted
+        seen_links = set() if self.site_config.get('remove_duplicates', True) else None
+        
+        for container in article_containers:
+            try:
+                article = self._extract_article_from_container(container, now, seen_links)
+                if article:
+                    articles.append(article)
+            except Exception as e:
+                self.log(f"Error extracting article: {str(e)}")
+        
+        self.log(f"Total articles found: {len(articles)}")
+        
+        # Articles only hold strings, so free the page's tree now rather than at the next GC cycle
+        soup.decompose()
+        
+        return articles
+    
+    def _extract_article_from_container(self, container, now=None, seen_links=None):
+        """Extract article information from a container using configuration
+        
+        When ``seen_links`` is given, containers whose link is already in it are skipped,
+        and the link of a successfully extracted article is added to it.
+        """
         try:
             # Extract title
             title = ""
             if 'title' in self.site_config['selectors']:
-                title_elem = self._find_element(container, self.site_config['selectors']['title'])
+                title_elem = self._finders['title'](container)
                 if title_elem:
                     title = title_elem.get_text().strip()
             
@@ -117,13 +447,16 @@ class UniversalNewsScraper:
                 # Check if link selector is the same as title (title inside link)
                 if self.site_config['selectors']['link'] == 'same_as_title':
                     # Find the parent anchor of the title
-                    title_elem = self._find_element(container, self.site_config['selectors']['title'])
+                    title_elem = self._finders['title'](container)
                     if title_elem:
                         link_elem = title_elem.find_parent('a')
                         if not link_elem and title_elem.find('a'):
                             link_elem = title_elem.find('a')
                 else:
-                    link_elem = self._find_element(container, self.site_config['selectors']['link'])
+                    link_elem = self._finders['link'](container)
+                    # A fallback link only ever comes from the title, never from elsewhere in the card
+                    if not link_elem and title_elem and self._link_falls_back_to_title:
+                        link_elem = self._title_anchor(title_elem)
                 
                 if link_elem and link_elem.get('href'):
                     link = link_elem.get('href')
@@ -132,46 +465,52 @@ class UniversalNewsScraper:
                 return None
             
             # Make absolute URL
-            full_url = urljoin(self.site_config['url'], link)
+            full_url = self._absolutize(link)
+            
+            # Skip links already extracted; a link is only recorded once its article is fully built
+            if seen_links is not None and full_url in seen_links:
+                return None
             
             # Extract summary
             summary = ""
             if 'summary' in self.site_config['selectors']:
-                summary_elem = self._find_element(container, self.site_config['selectors']['summary'])
+                summary_elem = self._finders['summary'](container)
                 if summary_elem:
                     summary = summary_elem.get_text().strip()
             
             # Extract publish date
             publish_date = None
             if 'date' in self.site_config['selectors']:
-                date_elem = self._find_element(container, self.site_config['selectors']['date'])
+                date_elem = self._finders['date'](container)
                 if date_elem:
                     # Try datetime attribute first
                     publish_date = date_elem.get('datetime') or date_elem.get_text().strip()
                     # Apply custom date parser if provided
-                    if 'date_parser' in self.site_config and self.site_config['date_parser']:
+                    if self._date_parser_takes_now:
+                        publish_date = self.site_config['date_parser'](publish_date, now=now)
+                    elif 'date_parser' in self.site_config and self.site_config['date_parser']:
                         publish_date = self.site_config['date_parser'](publish_date)
                     else:
-                        publish_date = self._parse_relative_date(publish_date)
+                        publish_date = self._parse_relative_date(publish_date, now)
             
             # Extract category
             category = None
             if 'category' in self.site_config['selectors']:
-                category_elem = self._find_element(container, self.site_config['selectors']['category'])
+                category_elem = self._finders['category'](container)
                 if category_elem:
                     category = category_elem.get_text().strip()
             
             # Extract author
             author = None
             if 'author' in self.site_config['selectors']:
-                author_elem = self._find_element(container, self.site_config['selectors']['author'])
+                author_elem = self._finders['author'](container)
                 if author_elem:
                     author = author_elem.get_text().strip()
             
             # Extract image URL
             image_url = None
             if 'image' in self.site_config['selectors']:
-                image_elem = self._find_element(container, self.site_config['selectors']['image'])
+                image_elem = self._finders['image'](container)
                 if image_elem:
                     if image_elem.name == 'img':
                         image_url = image_elem.get('src') or image_elem.get('data-src')
@@ -181,86 +520,114 @@ class UniversalNewsScraper:
                             image_url = img_tag.get('src') or img_tag.get('data-src')
                     
                     if image_url:
-                        image_url = urljoin(self.site_config['url'], image_url)
+                        image_url = self._absolutize(image_url)
             
-            # Build article dict
-            article = {
-                'title': title,
-                'link': full_url,
-                'summary': summary,
-                'publish_date': publish_date,
-                'category': category,
-                'author': author,
-                'image_url': image_url,
-                'source': self.site_config['name']
-            }
+            # Build article
+            article = Article(
+                title=title,
+                link=full_url,
+                summary=summary,
+                publish_date=publish_date,
+                category=category,
+                author=author,
+                image_url=image_url,
+                source=self.site_config['name']
+            )
             
             # Apply custom processing if provided
             if 'post_process' in self.site_config and self.site_config['post_process']:
                 article = self.site_config['post_process'](article, container)
             
+            if seen_links is not None and article:
+                seen_links.add(full_url)
+            
             return article
         
         except Exception as e:
             self.log(f"Error extracting article from container: {str(e)}")
             return None
     
-    def _find_element(self, container, selector_config):
-        """Find an element using selector configuration"""
-        if isinstance(selector_config, str):
-            # Simple selector
-            return container.select_one(selector_config)
-        elif isinstance(selector_config, list):
-            # Multiple selectors, try each until one works
-            for selector in selector_config:
-                elem = container.select_one(selector)
-                if elem:
-                    return elem
-            return None
-        elif isinstance(selector_config, dict):
-            # Advanced selector with multiple attempts
+    def _absolutize(self, href):
+        """Make a link absolute, handling the common absolute and root-relative cases cheaply"""
+        if href.startswith(('http://', 'https://')):
+            return href
+        if href.startswith('/') and not href.startswith('//') and '/.' not in href:
+            return self._scheme_netloc + href
+        return urljoin(self.site_config['url'], href)
+    
+    def _title_anchor(self, title_elem):
+        """Find the anchor that is, wraps or sits inside the title element"""
+        if title_elem.name == 'a':
+            return title_elem
+        return title_elem.find_parent('a') or title_elem.find('a')
+    
+    def _make_finder(self, key):
+        """Resolve a field's selector configuration once into a callable that finds its element"""
+        compiled = self.compiled_selectors.get(key)
+        if compiled is None:
+            # Advanced dict selectors become a chain of lookups tried in order.
+            # Tag, class and attrs lookups end the chain whether or not they match.
+            selector_config = self.site_config['selectors'][key]
+            if not isinstance(selector_config, dict):
+                return lambda container: None
+            
+            steps = []
             for selector_type, selector_value in selector_config.items():
                 if selector_type == 'css':
                     for selector in (selector_value if isinstance(selector_value, list) else [selector_value]):
-                        elem = container.select_one(selector)
-                        if elem:
-                            return elem
+                        steps.append((compile_selector(selector).select_one, False))
                 elif selector_type == 'tag':
-                    return container.find(selector_value)
+                    steps.append((lambda container, name=selector_value: container.find(name), True))
                 elif selector_type == 'class':
-                    return container.find(class_=selector_value)
+                    steps.append((lambda container, cls=selector_value: container.find(class_=cls), True))
                 elif selector_type == 'attrs':
-                    return container.find(attrs=selector_value)
+                    steps.append((lambda container, attrs=selector_value: container.find(attrs=attrs), True))
+            
+            def find_advanced(container):
+                for find, final in steps:
+                    elem = find(container)
+                    if elem or final:
+                        return elem
+                return None
+            return find_advanced
+        
+        # A single selector needs no loop
+        if len(compiled) == 1:
+            return compiled[0].select_one
+        
+        def find_first(container):
+            # Try each selector until one matches
+            for selector in compiled:
+                elem = selector.select_one(container)
+                if elem:
+                    return elem
             return None
+        return find_first
     
-    def _parse_relative_date(self, date_text):
+    def _parse_relative_date(self, date_text, now=None):
         """Parse relative dates like '2 hours ago' to ISO format"""
         if not date_text:
             return None
         
         date_text = date_text.lower().strip()
-        now = datetime.datetime.now()
         
-        # Handle relative dates
+        # Handle relative dates, only reading the clock once one is recognised
         if 'minute' in date_text or 'min' in date_text:
-            match = re.search(r'(\d+)', date_text)
-            if match:
-                minutes = int(match.group(1))
-                return (now - datetime.timedelta(minutes=minutes)).isoformat()
+            unit = _MINUTE
         elif 'hour' in date_text:
-            match = re.search(r'(\d+)', date_text)
-            if match:
-                hours = int(match.group(1))
-                return (now - datetime.timedelta(hours=hours)).isoformat()
+            unit = _HOUR
         elif 'day' in date_text:
-            match = re.search(r'(\d+)', date_text)
-            if match:
-                days = int(match.group(1))
-                return (now - datetime.timedelta(days=days)).isoformat()
+            unit = _DAY
         elif 'yesterday' in date_text:
-            return (now - datetime.timedelta(days=1)).isoformat()
+            return ((now or datetime.datetime.now()) - _DAY).isoformat()
         elif 'today' in date_text:
-            return now.isoformat()
+            return (now or datetime.datetime.now()).isoformat()
+        else:
+            return date_text
+        
+        match = _NUMBER_RE.search(date_text)
+        if match:
+            return ((now or datetime.datetime.now()) - unit * int(match.group(1))).isoformat()
         
         return date_text  # Return as-is if we can't parse it
     
@@ -277,8 +644,8 @@ class UniversalNewsScraper:
         filepath = os.path.join(self.output_dir, filename)
         
         # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(_json_dumps(articles))
         
         self.log(f"Data saved to: {filepath}")
         return filepath
@@ -295,18 +662,78 @@ class UniversalNewsScraper:
         
         filepath = os.path.join(self.output_dir, filename)
         
-        # Prepare fields
-        fieldnames = ['title', 'link', 'summary', 'publish_date', 'category', 'author', 'image_url', 'source']
-        
-        # Write to CSV
+        # Write to CSV in one batch, with every field present in each row
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for article in articles:
-                # Ensure all fields are present
-                row = {field: article.get(field, '') for field in fieldnames}
-                writer.writerow(row)
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(map(_csv_row, articles))
         
         self.log(f"CSV data saved to: {filepath}")
-        return filepath
\ No newline at end of file
+        return filepath
+
+class ArticleStreamWriter:
+    """Writes articles to JSON and/or CSV files batch by batch instead of all at once"""
+    
+    def __init__(self, basename, write_json=True, write_csv=True, output_dir=OUTPUT_DIR):
+        self.json_path = os.path.join(output_dir, f"{basename}.json") if write_json else None
+        self.csv_path = os.path.join(output_dir, f"{basename}.csv") if write_csv else None
+        self.output_dir = output_dir
+        self.count = 0
+        self._json_file = None
+        self._csv_file = None
+        self._csv_writer = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _open(self):
+        """Open the output files; done lazily so empty runs leave no files behind"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        
+        if self.json_path:
+            self._json_file = open(self.json_path, 'w', encoding='utf-8')
+        
+        if self.csv_path:
+            self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.writer(self._csv_file)
+            self._csv_writer.writerow(CSV_FIELDNAMES)
+    
+    def write(self, articles):
+        """Append a batch of articles to the output files"""
+        if not articles:
+            return
+        
+        if self.count == 0:
+            self._open()
+        
+        if self._json_file:
+            # Match the layout of json.dump(articles, indent=2) one article at a time
+            for i, article in enumerate(articles, start=self.count):
+                self._json_file.write(',\n' if i else '[\n')
+                self._json_file.write(textwrap.indent(json.dumps(article, indent=2, ensure_ascii=False, default=_json_default), '  '))
+        
+        if self._csv_writer:
+            self._csv_writer.writerows(map(_csv_row, articles))
+        
+        self.count += len(articles)
+    
+    def close(self):
+        """Finish and close the output files, returning the paths that were written"""
+        paths = []
+        
+        if self._json_file:
+            self._json_file.write('\n]')
+            self._json_file.close()
+            self._json_file = None
+            paths.append(self.json_path)
+        
+        if self._csv_file:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+            paths.append(self.csv_path)
+        
+        return paths